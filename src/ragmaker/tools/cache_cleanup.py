@@ -14,13 +14,13 @@ import sys
 logging.disable(logging.CRITICAL)
 
 import argparse
-import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
-    from ragmaker.io_utils import handle_file_not_found_error, handle_unexpected_error
+    from ragmaker.io_utils import print_json_stdout, handle_file_not_found_error, handle_unexpected_error
 except ImportError:
     sys.stderr.write('{"status": "error", "message": "The \'ragmaker\' package is required. Please install it."}\n')
     sys.exit(1)
@@ -29,37 +29,58 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Entries that survive a cleanup: exact names, and name suffixes.
+KEEP_NAMES = frozenset({'catalog.json'})
+KEEP_SUFFIXES = ('.md',)
+
+# Upper bound on concurrent deletions, to avoid exhausting file descriptors
+# while rmtree walks several large trees at once.
+MAX_DELETE_WORKERS = 32
+
+
 # --- Core Logic ---
+def _delete_one(item_path: str, is_dir: bool) -> str:
+    """Deletes a single file or directory tree and returns its path."""
+    if is_dir:
+        shutil.rmtree(item_path)
+        logger.debug("Deleted directory: %s", item_path)
+    else:
+        os.unlink(item_path)
+        logger.debug("Deleted file: %s", item_path)
+    return item_path
+
+
 def cleanup_directory(target_dir: Path) -> tuple[list[str], list[str]]:
     """
     Deletes files and directories in the target directory, with exceptions.
     """
     if not target_dir.is_dir():
-        logger.error(f"Target directory not found: {target_dir}")
+        logger.error("Target directory not found: %s", target_dir)
         raise FileNotFoundError(f"Target directory not found: {target_dir}")
 
     deleted_items = []
     kept_items = []
 
-    items_to_delete = []
-    for item_path in target_dir.glob('*'):
-        if item_path.name == 'catalog.json' or item_path.suffix == '.md':
-            kept_items.append(str(item_path))
-            continue
-        items_to_delete.append(item_path)
-
-    for item_path in items_to_delete:
-        try:
-            if item_path.is_dir():
-                shutil.rmtree(item_path)
-                logger.info(f"Deleted directory: {item_path}")
-            else:
-                item_path.unlink()
-                logger.info(f"Deleted file: {item_path}")
-            deleted_items.append(str(item_path))
-        except OSError as e:
-            logger.error(f"Error deleting {item_path}: {e}")
-
+    # os.scandir exposes each entry's type from the directory listing itself,
+    # so classifying an item costs no extra stat call. Deletions are I/O-bound,
+    # so they are handed to a thread pool as the entries are listed.
+    with ThreadPoolExecutor(max_workers=min(MAX_DELETE_WORKERS, (os.cpu_count() or 1) + 4)) as executor:
+        futures = {}
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                if entry.name in KEEP_NAMES or entry.name.endswith(KEEP_SUFFIXES):
+                    kept_items.append(entry.path)
+                    continue
+                future = executor.submit(_delete_one, entry.path, entry.is_dir(follow_symlinks=False))
+                futures[future] = entry.path
+
+        for future in as_completed(futures):
+            try:
+                deleted_items.append(future.result())
+            except OSError as e:
+                logger.error("Error deleting %s: %s", futures[future], e)
+
+    logger.info("Deleted %d items, kept %d items in %s", len(deleted_items), len(kept_items), target_dir)
     return deleted_items, kept_items
 
 # --- Main Execution ---
@@ -73,15 +94,17 @@ def main():
         target_path = Path(args.target_dir)
 
         deleted, kept = cleanup_directory(target_path)
+        deleted.sort()
+        kept.sort()
 
         result = {
             "status": "success",
-            "target_directory": str(target_path.resolve()),
-            "deleted_items": sorted(deleted),
-            "kept_items": sorted(kept),
+            "target_directory": os.path.abspath(target_path),
+            "deleted_items": deleted,
+            "kept_items": kept,
             "summary": f"Deleted {len(deleted)} items, kept {len(kept)} items."
         }
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        print_json_stdout(result)
 
     except FileNotFoundError as e:
         handle_file_not_found_error(e)
@@ -10,13 +10,13 @@ import sys
 logging.disable(logging.CRITICAL)
 
 import argparse
-import json
+import os
 import shutil
 import importlib.resources
 from pathlib import Path
 
 try:
-    from ragmaker.io_utils import handle_io_error, handle_unexpected_error
+    from ragmaker.io_utils import print_json_stdout, handle_io_error, handle_unexpected_error
 except ImportError:
     sys.stderr.write('{"status": "error", "message": "The \'ragmaker\' package is required. Please install it."}\n')
     sys.exit(1)
@@ -31,12 +31,11 @@ def create_knowledge_base(kb_root: Path):
     """
     Sets up the basic directory structure and files for a new knowledge base.
     """
-    # Exceptions are propagated to main for handling
-    kb_root.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Knowledge base root created at: {kb_root.resolve()}")
-
+    # Exceptions are propagated to main for handling.
+    # Creating the deepest directory with parents=True also creates kb_root.
     dest_commands_dir = kb_root / ".gemini" / "commands"
     dest_commands_dir.mkdir(parents=True, exist_ok=True)
+    logger.info("Knowledge base root created at: %s", kb_root)
 
 
 
@@ -55,9 +54,9 @@ def main():
         result = {
             "status": "success",
             "message": "Knowledge base created successfully.",
-            "knowledge_base_root": str(kb_root_path.resolve())
+            "knowledge_base_root": os.path.abspath(kb_root_path)
         }
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        print_json_stdout(result)
 
     except (IOError, OSError) as e:
         handle_io_error(e)
@@ -36,6 +36,8 @@ import json
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, List
 
@@ -100,7 +102,7 @@ class HTMLProcessor:
         Extracts main content from an HTML file using readabilipy,
         cleans it, and converts it to Markdown.
         """
-        logger.debug(f"Processing HTML file with readabilipy: {file_path}")
+        logger.debug("Processing HTML file with readabilipy: %s", file_path)
         try:
             html_content = file_path.read_text(encoding='utf-8')
             
@@ -108,14 +110,14 @@ class HTMLProcessor:
             try:
                 article = simple_json_from_html_string(html_content, use_readability=True)
             except IndexError:
-                logger.warning(f"readabilipy encountered an IndexError (likely due to missing Node.js/Readability.js and complex HTML). Falling back to basic extraction for {file_path}.")
+                logger.warning("readabilipy encountered an IndexError (likely due to missing Node.js/Readability.js and complex HTML). Falling back to basic extraction for %s.", file_path)
                 article = simple_json_from_html_string(html_content, use_readability=False)
             except Exception as e:
-                logger.error(f"Unexpected error in readabilipy for {file_path}: {e}")
+                logger.error("Unexpected error in readabilipy for %s: %s", file_path, e)
                 return None
 
             if not article or not article.get('content'):
-                logger.warning(f"readabilipy could not extract content from {file_path}.")
+                logger.warning("readabilipy could not extract content from %s.", file_path)
                 return None
 
             title = article.get('title', '')
@@ -135,7 +137,7 @@ class HTMLProcessor:
             return markdown_content
 
         except Exception as e:
-            logger.error(f"Failed during HTML content extraction or conversion for {file_path}: {e}", exc_info=True)
+            logger.error("Failed during HTML content extraction or conversion for %s: %s", file_path, e, exc_info=True)
             return None
 
 class DocumentProcessor:
@@ -146,7 +148,7 @@ class DocumentProcessor:
         """
         Converts a document (e.g., PDF, DOCX) to Markdown using markitdown.
         """
-        logger.debug(f"Processing document with markitdown: {file_path}")
+        logger.debug("Processing document with markitdown: %s", file_path)
         try:
             # MarkItDown is instantiated and used to convert the file.
             converter = MarkItDown()
@@ -157,9 +159,12 @@ class DocumentProcessor:
                 return markdown_content.text_content
             return str(markdown_content)
         except Exception as e:
-            logger.error(f"Failed during document conversion for {file_path}: {e}", exc_info=True)
+            logger.error("Failed during document conversion for %s: %s", file_path, e, exc_info=True)
             return None
 
+# Plain-file copies are I/O-bound, so they run on a small thread pool.
+MAX_COPY_WORKERS = 16
+
 # --- Core Logic ---
 def sync_and_convert_files(source_dir: Path, dest_dir: Path) -> List[dict]:
     """
@@ -179,22 +184,47 @@ def sync_and_convert_files(source_dir: Path, dest_dir: Path) -> List[dict]:
 
     try:
         # Use a temporary directory for processing
-        with tempfile.TemporaryDirectory() as work_dir_str:
+        with tempfile.TemporaryDirectory() as work_dir_str, \
+                ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as copier:
             work_dir = Path(work_dir_str)
             work_dir.mkdir(parents=True, exist_ok=True)
+            # Pending copies keyed by destination, so a conversion that writes
+            # the same file waits for the copy first and the walk order still
+            # decides which file wins.
+            copies = {}
+            failed_indices = set()
+            created_dirs = set()
+
+            def report_failure(future, source_file_path):
+                # Runs as soon as the copy finishes, so failures are logged when they happen.
+                if future.exception() is not None:
+                    logger.error("Failed to copy text file '%s': %s", source_file_path, future.exception())
+
+            def finish_copy(dest_key):
+                future, source_file_path, dest_file_path, index = copies.pop(dest_key)
+                if future.exception() is not None:
+                    # Like a failed conversion, a failed copy skips only that file.
+                    dest_file_path.unlink(missing_ok=True)
+                    failed_indices.add(index)
+                    return
+                logger.info("Copied text file '%s' to '%s'", source_file_path, dest_file_path)
 
             for root, _, files in os.walk(source_dir):
                 for filename in files:
-                    source_file_path = Path(root) / filename
-                    file_ext = source_file_path.suffix.lower()
+                    # Classify on the bare name so skipped files never build a Path.
+                    file_ext = os.path.splitext(filename)[1].lower()
 
                     if file_ext not in all_supported_ext:
-                        logger.info(f"Ignoring unsupported file type: {source_file_path}")
+                        logger.info("Ignoring unsupported file type: %s", os.path.join(root, filename))
                         continue
 
+                    source_file_path = Path(root) / filename
+
                     relative_path = source_file_path.relative_to(source_dir)
                     dest_file_path = work_dir / relative_path
-                    dest_file_path.parent.mkdir(parents=True, exist_ok=True)
+                    if dest_file_path.parent not in created_dirs:
+                        dest_file_path.parent.mkdir(parents=True, exist_ok=True)
+                        created_dirs.add(dest_file_path.parent)
 
                     final_dest_path = dest_file_path
 
@@ -202,32 +232,45 @@ def sync_and_convert_files(source_dir: Path, dest_dir: Path) -> List[dict]:
                         markdown_content = HTMLProcessor.convert_html_file_to_markdown(source_file_path)
                         if markdown_content:
                             final_dest_path = dest_file_path.with_suffix('.md')
+                            if os.path.normcase(final_dest_path) in copies:
+                                finish_copy(os.path.normcase(final_dest_path))
                             final_dest_path.write_text(str(markdown_content), encoding='utf-8')
-                            logger.info(f"Converted HTML '{source_file_path}' to '{final_dest_path}'")
+                            logger.info("Converted HTML '%s' to '%s'", source_file_path, final_dest_path)
                         else:
-                            logger.warning(f"Skipping HTML file {source_file_path} due to conversion failure.")
+                            logger.warning("Skipping HTML file %s due to conversion failure.", source_file_path)
                             continue
                     elif file_ext in doc_ext:
                         markdown_content = DocumentProcessor.convert_document_to_markdown(source_file_path)
                         if markdown_content:
                             final_dest_path = dest_file_path.with_suffix('.md')
+                            if os.path.normcase(final_dest_path) in copies:
+                                finish_copy(os.path.normcase(final_dest_path))
                             final_dest_path.write_text(str(markdown_content), encoding='utf-8')
-                            logger.info(f"Converted document '{source_file_path}' to '{final_dest_path}'")
+                            logger.info("Converted document '%s' to '%s'", source_file_path, final_dest_path)
                         else:
-                            logger.warning(f"Skipping document file {source_file_path} due to conversion failure.")
+                            logger.warning("Skipping document file %s due to conversion failure.", source_file_path)
                             continue
                     elif file_ext in text_ext:
-                        shutil.copy2(source_file_path, dest_file_path)
-                        logger.info(f"Copied text file '{source_file_path}' to '{dest_file_path}'")
+                        if os.path.normcase(dest_file_path) in copies:
+                            finish_copy(os.path.normcase(dest_file_path))
+                        future = copier.submit(shutil.copy2, source_file_path, dest_file_path)
+                        future.add_done_callback(partial(report_failure, source_file_path=source_file_path))
+                        copies[os.path.normcase(dest_file_path)] = (future, source_file_path, dest_file_path, len(processed_files))
 
                     processed_files.append({
                         "path": final_dest_path.relative_to(work_dir).as_posix()
                     })
 
+            # Wait for the copies before exporting, dropping the ones that failed
+            for dest_key in list(copies):
+                finish_copy(dest_key)
+            if failed_indices:
+                processed_files = [entry for i, entry in enumerate(processed_files) if i not in failed_indices]
+
             # Safe export to destination
             safe_export(work_dir, dest_dir)
 
-        logger.info(f"File synchronization and conversion successful. Processed {len(processed_files)} files.")
+        logger.info("File synchronization and conversion successful. Processed %d files.", len(processed_files))
         return processed_files
 
     except (shutil.Error, OSError, Exception) as e:
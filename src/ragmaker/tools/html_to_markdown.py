@@ -16,8 +16,10 @@ import argparse
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin
 
 # --- Dependency and Utility Loading ---
 try:
@@ -33,30 +35,52 @@ except ImportError:
 
 # --- Tool Characteristics & Setup ---
 logger = logging.getLogger(__name__)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+# Below this many files, converting in-process is faster than starting worker
+# processes, which re-import the whole conversion stack under spawn.
+MIN_JOBS_FOR_POOL = 4
 
 # --- Core Conversion Logic ---
 
+_BASE_RE = re.compile(r'<base\s+href=["\']([^"\']+)["\']', re.IGNORECASE)
+_LINK_RE = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+# Leading whitespace is allowed, as urlparse strips it before reading the scheme.
+_SCHEME_RE = re.compile(r'\s*[A-Za-z][A-Za-z0-9+.\-]*:')
+
 def extract_base_url_from_html(html_content: str) -> str | None:
-    base_match = re.search(r'<base\s+href=["\']([^"\']+)["\']', html_content, re.IGNORECASE)
+    base_match = _BASE_RE.search(html_content)
     return base_match.group(1) if base_match else None
 
+# Navigation and footer links repeat across every page of a site, so the
+# urljoin results are cached for the whole run.
+@lru_cache(maxsize=8192)
+def _cached_urljoin(base: str, url: str) -> str:
+    return urljoin(base, url)
+
+def _replace_link(base_url: str | None, match: re.Match) -> str:
+    link_text, link_url = match.groups()
+    # Anchors and absolute URLs are left as they are; reuse the matched text.
+    if link_url.startswith('#') or _SCHEME_RE.match(link_url):
+        return match.group(0)
+    fixed_url = _cached_urljoin(base_url, link_url) if base_url and not link_url.startswith('/') else link_url
+    if fixed_url.lower().endswith(('.html', '.htm')):
+        fixed_url = os.path.splitext(fixed_url)[0] + '.md'
+    return f'[{link_text}]({fixed_url})'
+
 def fix_links_in_markdown(markdown_content: str, base_url: str | None = None) -> str:
-    def replace_link(match):
-        link_text, link_url = match.groups()
-        if link_url.startswith('#') or urlparse(link_url).scheme:
-            return f'[{link_text}]({link_url})'
-        fixed_url = urljoin(base_url, link_url) if base_url and not link_url.startswith('/') else link_url
-        if fixed_url.lower().endswith(('.html', '.htm')):
-            fixed_url = os.path.splitext(fixed_url)[0] + '.md'
-        return f'[{link_text}]({fixed_url})'
-    return re.sub(r'\[([^\]]*)\]\(([^)]+)\)', replace_link, markdown_content)
+    return _LINK_RE.sub(partial(_replace_link, base_url), markdown_content)
 
 def read_html_file(file_path: Path) -> str:
+    # Read the file once and try each encoding on the in-memory bytes.
+    data = file_path.read_bytes()
     for encoding in ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252']:
         try:
-            return file_path.read_text(encoding=encoding)
+            text = data.decode(encoding)
         except UnicodeDecodeError:
             continue
+        # Match the universal-newline translation of text-mode reads.
+        return text.replace('\r\n', '\n').replace('\r', '\n')
     raise IOError(f"Cannot decode file {file_path} with any supported encoding")
 
 def convert_html_to_markdown(html_file_path: Path, base_url: str | None = None) -> tuple[str, str]:
@@ -68,7 +92,7 @@ def convert_html_to_markdown(html_file_path: Path, base_url: str | None = None)
         title = article.get('title', html_file_path.stem)
         content = article.get('content', html_content)
     except Exception as e:
-        logger.warning(f"ReadabiliPy failed for {html_file_path}: {e}, falling back to full HTML.")
+        logger.warning("ReadabiliPy failed for %s: %s, falling back to full HTML.", html_file_path, e)
         title = html_file_path.stem
         content = html_content
     
@@ -80,6 +104,40 @@ def convert_html_to_markdown(html_file_path: Path, base_url: str | None = None)
     
     return title, markdown_content
 
+def _init_worker(disable_level: int, log_level: int) -> None:
+    """
+    Mirrors the parent's logging setup in a conversion worker process.
+
+    Spawned workers re-import this module, which disables logging, so warnings
+    such as the ReadabiliPy fallback would otherwise be lost.
+    """
+    logging.disable(disable_level)
+    if not logging.root.handlers:
+        logging.basicConfig(level=log_level, format=LOG_FORMAT, stream=sys.stderr)
+
+def _convert_file(html_file: Path, md_file: Path, base_url: str | None) -> None:
+    """
+    Converts one HTML file, writes the Markdown next to it and removes the source.
+
+    May run in a worker process, so it must stay at module level to be picklable.
+    """
+    logger.info("Converting %s to %s", html_file, md_file)
+    _title, markdown_content = convert_html_to_markdown(html_file, base_url)
+
+    md_file.write_text(markdown_content, encoding='utf-8')
+
+    html_file.unlink()
+
+def _apply_conversions(jobs: list, outcomes) -> None:
+    """Runs each conversion outcome in order, updating the paths of converted documents."""
+    for (doc, html_file, _md_file, md_path_str), outcome in zip(jobs, outcomes):
+        try:
+            outcome()
+            doc["path"] = md_path_str # Update path in the dictionary
+        except Exception:
+            logger.exception("Failed to convert or write %s", html_file)
+            # Log and continue, leaving the original path in place.
+
 # --- Main Logic ---
 
 def process_and_update_catalog(
@@ -98,11 +156,13 @@ def process_and_update_catalog(
 
     documents = catalog_data.get("documents", [])
 
+    # Collect the conversions first; the catalog walk itself is cheap.
+    jobs = []
     for doc in documents:
         original_path_str = doc.get("path")
 
         if not isinstance(original_path_str, str) or not original_path_str.lower().endswith(('.html', '.htm')):
-            logger.debug(f"Skipping non-HTML entry: {original_path_str}")
+            logger.debug("Skipping non-HTML entry: %s", original_path_str)
             continue
 
         html_file = input_dir / original_path_str
@@ -115,19 +175,30 @@ def process_and_update_catalog(
             # We log the error but continue processing, the path remains unchanged.
             continue
 
-        try:
-            logger.info(f"Converting {html_file} to {md_file}")
-            _title, markdown_content = convert_html_to_markdown(html_file, base_url)
-
-            md_file.parent.mkdir(parents=True, exist_ok=True)
-            md_file.write_text(markdown_content, encoding='utf-8')
-
-            html_file.unlink()
-            doc["path"] = md_path_str # Update path in the dictionary
-
-        except Exception as e:
-            logger.exception(f"Failed to convert or write {html_file}")
-            # Log and continue, leaving the original path in place.
+        jobs.append((doc, html_file, md_file, md_path_str))
+
+    if not jobs:
+        return catalog_data
+
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    if len(jobs) < MIN_JOBS_FOR_POOL or max_workers < 2:
+        _apply_conversions(jobs, (
+            partial(_convert_file, html_file, md_file, base_url)
+            for _doc, html_file, md_file, _md_path_str in jobs
+        ))
+        return catalog_data
+
+    # Readability extraction and markdownify are CPU-bound and independent per
+    # file, so larger batches run in a process pool.
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(logging.root.manager.disable, logging.getLogger().getEffectiveLevel()),
+    ) as executor:
+        _apply_conversions(jobs, [
+            executor.submit(_convert_file, html_file, md_file, base_url).result
+            for _doc, html_file, md_file, _md_path_str in jobs
+        ])
 
     return catalog_data
 
@@ -138,7 +209,7 @@ def main() -> None:
     logging.disable(logging.NOTSET)
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
+        format=LOG_FORMAT,
         stream=sys.stderr
     )
 
@@ -157,8 +228,8 @@ def main() -> None:
         catalog_path = Path(args.catalog_path)
         input_dir = Path(args.input_dir)
 
-        logger.info(f"Processing catalog file: {catalog_path}")
-        logger.info(f"Reading HTML files from: {input_dir}")
+        logger.info("Processing catalog file: %s", catalog_path)
+        logger.info("Reading HTML files from: %s", input_dir)
 
         updated_catalog_data = process_and_update_catalog(catalog_path, input_dir, args.base_url)
 
@@ -166,7 +237,7 @@ def main() -> None:
         print_json_stdout(updated_catalog_data)
 
     except (ArgumentParsingError, FileNotFoundError) as e:
-        logger.error(f"A handled error occurred: {e}")
+        logger.error("A handled error occurred: %s", e)
         eprint_error({
             "status": "error",
             "error_code": "BAD_REQUEST",
@@ -20,8 +20,9 @@ import json
 import re
 import shutil
 import subprocess
+from collections import deque
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
 from datetime import datetime, timezone
 from bs4 import Tag
 
@@ -43,13 +44,14 @@ except ImportError:
 
 try:
     import requests
+    import lxml.html
     from bs4 import BeautifulSoup
     from markdownify import markdownify as md
 except ImportError:
     eprint_error({
         "status": "error",
         "error_code": "DEPENDENCY_ERROR",
-        "message": "Required libraries 'requests', 'beautifulsoup4', or 'markdownify' not found.",
+        "message": "Required libraries 'requests', 'beautifulsoup4', 'lxml', or 'markdownify' not found.",
         "remediation_suggestion": "Please ensure required libraries are installed."
     })
     sys.exit(1)
@@ -57,6 +59,8 @@ except ImportError:
 # --- Tool Characteristics ---
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
 
 # --- Structured Error Handling (Tool-specific) ---
 def handle_request_error(url: str, exception: Exception):
@@ -86,6 +90,36 @@ def _is_noise_element(tag: Tag) -> bool:
                 return True
     return False
 
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL into the key used to detect already-visited pages.
+
+    Lowercases the scheme and host, drops default ports, the fragment and a
+    trailing slash, and sorts query parameters, so trivially different
+    spellings of the same page are fetched only once.
+    """
+    parsed = urlparse(url)
+    scheme = parsed.scheme.lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        # An invalid port; keep the netloc as written rather than dropping the port.
+        netloc = parsed.netloc
+    else:
+        host = (parsed.hostname or '').lower()
+        if ':' in host:
+            host = f"[{host}]"  # IPv6 literal
+        netloc = host if port is None or _DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+        userinfo, at, _ = parsed.netloc.rpartition('@')
+        if at:
+            netloc = f"{userinfo}@{netloc}"
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return parsed._replace(
+        scheme=scheme, netloc=netloc, path=parsed.path.rstrip('/'), query=query, fragment=''
+    ).geturl()
+
 class WebFetcher:
     """Encapsulates logic for fetching and converting web pages."""
 
@@ -97,20 +131,28 @@ class WebFetcher:
         self.depth = args.depth
         self.visited_urls: set[str] = set()
         self.documents: list[dict] = []
+        # A crawl stays within one site, so reuse connections across requests.
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': USER_AGENT})
+
+    def _fetch_html_for_links(self, url: str) -> tuple[bytes, str | None] | None:
+        """
+        Fetch raw HTML bytes for link discovery.
 
-    def _fetch_html_for_links(self, url: str) -> str | None:
-        """Fetch HTML string for link discovery."""
+        Returns the body together with the charset declared in the
+        Content-Type header, if any, so lxml can decode it directly.
+        """
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
             content_type = response.headers.get('Content-Type', '')
             if 'text/html' not in content_type:
-                logger.warning(f"URL {url} is not HTML. Content-Type: {content_type}")
+                logger.warning("URL %s is not HTML. Content-Type: %s", url, content_type)
                 return None
-            return response.text
+            # requests falls back to ISO-8859-1 for text/* without a charset;
+            # in that case let lxml honour the page's own <meta charset>.
+            encoding = response.encoding if 'charset=' in content_type.lower() else None
+            return response.content, encoding
         except requests.exceptions.RequestException as e:
             handle_request_error(url, e)
             return None
@@ -139,13 +181,13 @@ class WebFetcher:
             article_json = json.loads(process.stdout)
 
             if not article_json or not article_json.get('html-content'):
-                logger.warning(f"readable-cli could not extract content from {url}.")
+                logger.warning("readable-cli could not extract content from %s.", url)
                 return None
 
             title = article_json.get('title', '')
             html_content = article_json['html-content']
 
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             for element in soup.find_all(_is_noise_element):
                 element.decompose()
 
@@ -168,7 +210,7 @@ class WebFetcher:
             return markdown_content
 
         except subprocess.CalledProcessError as e:
-            logger.error(f"readable-cli failed for {url} with code {e.returncode}.")
+            logger.error("readable-cli failed for %s with code %s.", url, e.returncode)
             return None
         except FileNotFoundError:
             logger.error("The 'readable' command could not be executed.")
@@ -178,56 +220,69 @@ class WebFetcher:
             })
             sys.exit(1)
         except (json.JSONDecodeError, Exception) as e:
-            logger.error(f"Failed during extraction or conversion for {url}: {e}")
+            logger.error("Failed during extraction or conversion for %s: %s", url, e)
             return None
 
-    def _find_links(self, html_content: str, page_url: str) -> list[str]:
+    def _find_links(self, html_content: bytes, page_url: str, encoding: str | None = None) -> list[str]:
         """Find all links in HTML content."""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        links = set()
-        for a_tag in soup.find_all('a', href=True):
-            if not isinstance(a_tag, Tag):
-                continue
-            href = a_tag.get('href')
-            if href:
-                if isinstance(href, list):
-                    href = href[0]
-                full_url = urljoin(page_url, href)
-                links.add(full_url)
+        # Only <a href> values are needed, so query lxml directly rather than
+        # building a BeautifulSoup tree on top of it. lxml decodes the bytes itself.
+        parser = None
+        if encoding:
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding)
+            except LookupError:
+                # A bogus charset in Content-Type; let lxml detect the encoding.
+                logger.debug("Unknown charset %r for %s, detecting it instead.", encoding, page_url)
+        try:
+            doc = lxml.html.fromstring(html_content, parser=parser)
+        except (lxml.etree.ParserError, ValueError) as e:
+            logger.warning("Could not parse links from %s: %s", page_url, e)
+            return []
+        links = {urljoin(page_url, href) for href in doc.xpath('//a/@href') if href}
         return list(links)
 
     def run(self):
         """Execute fetch and conversion process."""
-        logger.info(f"Starting fetch for URL: {self.start_url}")
+        try:
+            self._crawl()
+        finally:
+            self.session.close()
+
+    def _crawl(self):
+        """Breadth-first crawl from the start URL within the base URL scope."""
+        logger.info("Starting fetch for URL: %s", self.start_url)
         if not self.start_url.startswith(self.base_url):
-            logger.warning(f"Start URL is outside the base URL scope.")
+            logger.warning("Start URL is outside the base URL scope.")
             return
 
-        urls_to_visit = [(self.start_url, 0)]
+        urls_to_visit = deque([(self.start_url, 0)])
         page_counter = 0
 
         while urls_to_visit:
-            current_url, current_depth = urls_to_visit.pop(0)
-            if current_url in self.visited_urls:
+            current_url, current_depth = urls_to_visit.popleft()
+            visit_key = _canonicalize_url(current_url)
+            if visit_key in self.visited_urls:
                 continue
             if not self.recursive and len(self.visited_urls) > 0:
                 break
             if self.recursive and current_depth > self.depth:
                 continue
 
-            logger.info(f"Fetching: {current_url} at depth {current_depth}")
-            self.visited_urls.add(current_url)
+            logger.info("Fetching: %s at depth %s", current_url, current_depth)
+            self.visited_urls.add(visit_key)
 
             if self.recursive and current_depth < self.depth:
-                html_for_links = self._fetch_html_for_links(current_url)
-                if html_for_links:
-                    found_links = self._find_links(html_for_links, current_url)
+                fetched = self._fetch_html_for_links(current_url)
+                if fetched and fetched[0]:
+                    html_bytes, encoding = fetched
+                    found_links = self._find_links(html_bytes, current_url, encoding)
                     for link in found_links:
                         parsed_url = urlparse(link)
                         if parsed_url.scheme not in ['http', 'https']:
                             continue
                         clean_url = parsed_url._replace(fragment="").geturl()
-                        if clean_url.startswith(self.base_url) and clean_url not in self.visited_urls:
+                        if clean_url.startswith(self.base_url) and _canonicalize_url(clean_url) not in self.visited_urls:
                             urls_to_visit.append((clean_url, current_depth + 1))
             
             markdown_content = self._extract_and_convert(current_url)
@@ -246,7 +301,7 @@ class WebFetcher:
                 })
                 page_counter += 1
             except IOError as e:
-                logger.error(f"Failed to write file for {current_url}: {e}")
+                logger.error("Failed to write file for %s: %s", current_url, e)
 
 
 
@@ -41,7 +41,7 @@ def init_cache():
         # Step 2: Clean up the contents of the cache directory.
         cleanup_dir_contents(Path(cache_dir))
 
-        logger.info(f"Successfully initialized cache directory: {cache_dir}")
+        logger.info("Successfully initialized cache directory: %s", cache_dir)
 
         return f"Cache initialized at {cache_dir}"
 
@@ -61,7 +61,7 @@ def main():
     """Main entry point."""
     # This tool has no arguments.
     if len(sys.argv) > 1:
-        logger.warning(f"This script '{os.path.basename(__file__)}' does not accept any arguments. Ignoring provided arguments: {sys.argv[1:]}")
+        logger.warning("This script '%s' does not accept any arguments. Ignoring provided arguments: %s", os.path.basename(__file__), sys.argv[1:])
 
     try:
         message = init_cache()
@@ -124,33 +124,33 @@ def safe_export(src_dir: Path, dst_dir: Path) -> None:
             dst_path = dst_root / d
             if dst_path.exists() and not dst_path.is_dir():
                 if os.path.islink(dst_path):
-                    logger.error(f"Destination path '{dst_path}' is a symlink. Aborting to prevent unsafe deletion.")
+                    logger.error("Destination path '%s' is a symlink. Aborting to prevent unsafe deletion.", dst_path)
                     raise FileExistsError(f"Destination path '{dst_path}' is a symlink. Aborting.")
 
-                logger.warning(f"Removing file '{dst_path}' to replace with directory from source")
+                logger.warning("Removing file '%s' to replace with directory from source", dst_path)
                 try:
                     dst_path.unlink()
                 except OSError as e:
-                    logger.error(f"Failed to remove conflicting file {dst_path}: {e}")
+                    logger.error("Failed to remove conflicting file %s: %s", dst_path, e)
                     raise
 
         for f in files:
             dst_path = dst_root / f
             if dst_path.exists() and dst_path.is_dir():
                 if os.path.islink(dst_path):
-                    logger.error(f"Destination path '{dst_path}' is a symlink. Aborting to prevent unsafe deletion.")
+                    logger.error("Destination path '%s' is a symlink. Aborting to prevent unsafe deletion.", dst_path)
                     raise FileExistsError(f"Destination path '{dst_path}' is a symlink. Aborting.")
 
-                logger.warning(f"Removing directory '{dst_path}' to replace with file from source")
+                logger.warning("Removing directory '%s' to replace with file from source", dst_path)
                 try:
                     shutil.rmtree(dst_path)
                 except OSError as e:
-                    logger.error(f"Failed to remove conflicting directory {dst_path}: {e}")
+                    logger.error("Failed to remove conflicting directory %s: %s", dst_path, e)
                     raise
 
     try:
         shutil.copytree(src_dir, dst_dir, dirs_exist_ok=True)
-        logger.info(f"Safely exported files from {src_dir} to {dst_dir}")
+        logger.info("Safely exported files from %s to %s", src_dir, dst_dir)
     except Exception as e:
-        logger.error(f"Failed to export safely from {src_dir} to {dst_dir}: {e}")
+        logger.error("Failed to export safely from %s to %s: %s", src_dir, dst_dir, e)
         raise
\ No newline at end of file
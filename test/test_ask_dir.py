@@ -1,16 +1,53 @@
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
+import contextlib
 import json
 import io
 import os
-import importlib
+import types
 
 # Ensure src is in path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from ragmaker.tools import ask_dir
 
+
+def _make_tk_stub():
+    """Returns a lightweight stand-in for the tkinter module (read-only attribute access)."""
+    root = types.SimpleNamespace(
+        withdraw=lambda: None,
+        attributes=lambda *args: None,
+        update=lambda: None,
+    )
+    return types.SimpleNamespace(Tk=lambda: root)
+
+
+class _FakeFileBrowser:
+    """Minimal stand-in for tkfilebrowser that records which dialogs were opened."""
+    __slots__ = ("result", "calls")
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    def askopendirnames(self, **kwargs):
+        self.calls.append("askopendirnames")
+        return self.result
+
+    def askopendirname(self, **kwargs):
+        self.calls.append("askopendirname")
+        return self.result
+
+
+@contextlib.contextmanager
+def _patch_dialog_modules(tkfilebrowser):
+    """Patches ask_dir's tkinter and tkfilebrowser modules for the duration of the block."""
+    with patch('ragmaker.tools.ask_dir.tk', _make_tk_stub()), \
+         patch('ragmaker.tools.ask_dir.tkfilebrowser', tkfilebrowser):
+        yield tkfilebrowser
+
+
 class TestAskDir(unittest.TestCase):
 
     def setUp(self):
@@ -38,20 +75,12 @@ class TestAskDir(unittest.TestCase):
                 mock_ask.assert_called_with(initial_dir=None, multiple=False)
 
     def test_multiple_selection_success(self):
-        # Mock tkfilebrowser and tkinter
-        mock_tk = MagicMock()
-        mock_tkfilebrowser = MagicMock()
-
-        with patch('ragmaker.tools.ask_dir.tk', mock_tk), \
-             patch('ragmaker.tools.ask_dir.tkfilebrowser', mock_tkfilebrowser):
-
-            # Setup mock return for askopendirnames
-            mock_tkfilebrowser.askopendirnames.return_value = ["/path/dir1", "/path/dir2"]
+        with _patch_dialog_modules(_FakeFileBrowser(["/path/dir1", "/path/dir2"])) as browser:
 
             ask_dir.ask_for_directory(multiple=True)
 
             # Verify call
-            mock_tkfilebrowser.askopendirnames.assert_called_once()
+            self.assertEqual(browser.calls, ["askopendirnames"])
 
             # Verify output
             output = self.stdout.getvalue()
@@ -60,18 +89,11 @@ class TestAskDir(unittest.TestCase):
             self.assertEqual(data['selected_directories'], ["/path/dir1", "/path/dir2"])
 
     def test_single_selection_success(self):
-        # Mock tkfilebrowser
-        mock_tk = MagicMock()
-        mock_tkfilebrowser = MagicMock()
-
-        with patch('ragmaker.tools.ask_dir.tk', mock_tk), \
-             patch('ragmaker.tools.ask_dir.tkfilebrowser', mock_tkfilebrowser):
-
-            mock_tkfilebrowser.askopendirname.return_value = "/path/single"
+        with _patch_dialog_modules(_FakeFileBrowser("/path/single")) as browser:
 
             ask_dir.ask_for_directory(multiple=False)
 
-            mock_tkfilebrowser.askopendirname.assert_called_once()
+            self.assertEqual(browser.calls, ["askopendirname"])
 
             output = self.stdout.getvalue()
             data = json.loads(output)
@@ -79,10 +101,8 @@ class TestAskDir(unittest.TestCase):
             self.assertEqual(data['selected_directory'], "/path/single")
 
     def test_cancel_multiple(self):
-        with patch('ragmaker.tools.ask_dir.tk'), \
-             patch('ragmaker.tools.ask_dir.tkfilebrowser') as mock_tkfilebrowser:
-
-            mock_tkfilebrowser.askopendirnames.return_value = [] # Cancelled returns empty list/tuple
+        # Cancelled returns empty list/tuple
+        with _patch_dialog_modules(_FakeFileBrowser([])):
 
             with self.assertRaises(SystemExit):
                 ask_dir.ask_for_directory(multiple=True)
@@ -91,10 +111,8 @@ class TestAskDir(unittest.TestCase):
             self.assertIn("USER_CANCELLED", err_output)
 
     def test_cancel_single(self):
-        with patch('ragmaker.tools.ask_dir.tk'), \
-             patch('ragmaker.tools.ask_dir.tkfilebrowser') as mock_tkfilebrowser:
-
-            mock_tkfilebrowser.askopendirname.return_value = "" # Cancelled returns empty string
+        # Cancelled returns empty string
+        with _patch_dialog_modules(_FakeFileBrowser("")):
 
             with self.assertRaises(SystemExit):
                 ask_dir.ask_for_directory(multiple=False)
@@ -104,8 +122,7 @@ class TestAskDir(unittest.TestCase):
 
     def test_missing_tkfilebrowser_for_multiple(self):
         # Simulate tkfilebrowser missing (None)
-        with patch('ragmaker.tools.ask_dir.tk'), \
-             patch('ragmaker.tools.ask_dir.tkfilebrowser', None):
+        with _patch_dialog_modules(None):
 
             with self.assertRaises(SystemExit):
                 ask_dir.ask_for_directory(multiple=True)
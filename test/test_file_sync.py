@@ -5,7 +5,19 @@ import shutil
 from pathlib import Path
 import os
 import json
+import logging
 import sys
+import time
+from unittest.mock import patch
+
+# Add the src directory to the Python path to allow for direct imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+try:
+    from ragmaker.tools import file_sync
+except SystemExit:
+    # The tool exits at import time when its conversion dependencies are missing.
+    file_sync = None
 
 class TestFileSyncWithConversion(unittest.TestCase):
 
@@ -119,5 +131,77 @@ class TestFileSyncWithConversion(unittest.TestCase):
         self.assertSetEqual(paths, expected_paths)
 
 
+
+@unittest.skipIf(file_sync is None, "file_sync dependencies are not installed.")
+class TestFileSyncCopies(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.TemporaryDirectory()
+        self.source_dir = Path(self.test_dir.name) / "source"
+        self.dest_dir = Path(self.test_dir.name) / "destination"
+        self.source_dir.mkdir()
+        # The tool disables logging on import; re-enable it to observe reported failures
+        self._logging_disabled = logging.root.manager.disable
+        logging.disable(logging.NOTSET)
+
+    def tearDown(self):
+        logging.disable(self._logging_disabled)
+        self.test_dir.cleanup()
+
+    def test_same_destination_follows_walk_order(self):
+        """
+        Test that x.md (copied) and x.html (converted) never interleave their
+        writes to x.md: the file processed later wins.
+        """
+        (self.source_dir / "x.md").write_text("copied markdown", encoding='utf-8')
+        (self.source_dir / "x.html").write_text("<p>html</p>", encoding='utf-8')
+
+        real_copy2 = shutil.copy2
+        real_walk = os.walk
+
+        def ordered_walk(top, *args, **kwargs):
+            # Fix the listing order of the source directory; other walks are untouched
+            if Path(top) == self.source_dir:
+                return iter([(str(self.source_dir), [], order)])
+            return real_walk(top, *args, **kwargs)
+
+        def slow_copy2(src, dst):
+            # Without serialization this copy would land after the conversion
+            time.sleep(0.2)
+            return real_copy2(src, dst)
+
+        for order, expected in ((["x.md", "x.html"], "converted html"), (["x.html", "x.md"], "copied markdown")):
+            with self.subTest(order=order):
+                shutil.rmtree(self.dest_dir, ignore_errors=True)
+                with patch.object(file_sync.os, 'walk', side_effect=ordered_walk), \
+                     patch.object(file_sync.shutil, 'copy2', side_effect=slow_copy2), \
+                     patch.object(file_sync.HTMLProcessor, 'convert_html_file_to_markdown', return_value="converted html"):
+                    processed = file_sync.sync_and_convert_files(self.source_dir, self.dest_dir)
+
+                self.assertEqual([doc["path"] for doc in processed], ["x.md", "x.md"])
+                self.assertEqual((self.dest_dir / "x.md").read_text(encoding='utf-8'), expected)
+
+    def test_failed_copy_is_reported_and_others_are_copied(self):
+        """Test that one failing copy is logged and skipped without stopping the other copies."""
+        for name in ("a.txt", "b.md", "c.txt"):
+            (self.source_dir / name).write_text(f"content of {name}", encoding='utf-8')
+
+        real_copy2 = shutil.copy2
+
+        def failing_copy2(src, dst):
+            if Path(src).name == "b.md":
+                raise PermissionError(f"Permission denied: '{src}'")
+            return real_copy2(src, dst)
+
+        with patch.object(file_sync.shutil, 'copy2', side_effect=failing_copy2), \
+             self.assertLogs(file_sync.logger, level='ERROR') as logs:
+            processed = file_sync.sync_and_convert_files(self.source_dir, self.dest_dir)
+
+        self.assertTrue(any("b.md" in message for message in logs.output), logs.output)
+        self.assertEqual(sorted(doc["path"] for doc in processed), ["a.txt", "c.txt"])
+        self.assertEqual((self.dest_dir / "a.txt").read_text(encoding='utf-8'), "content of a.txt")
+        self.assertEqual((self.dest_dir / "c.txt").read_text(encoding='utf-8'), "content of c.txt")
+        self.assertFalse((self.dest_dir / "b.md").exists())
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,16 @@ import json
 import subprocess
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
+
+# Add the src directory to the Python path to allow for direct imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+try:
+    from ragmaker.tools import html_to_markdown
+except SystemExit:
+    # The tool exits at import time when its conversion dependencies are missing.
+    html_to_markdown = None
 
 class TestHtmlToMarkdown(unittest.TestCase):
 
@@ -128,5 +138,78 @@ class TestHtmlToMarkdown(unittest.TestCase):
         self.assertTrue((self.input_dir / "convert.md").exists(), "Markdown file for existing HTML should be created")
         self.assertIn("HTML source file not found, skipping", stderr, "An error for the missing file should be logged to stderr")
 
+
+@unittest.skipIf(html_to_markdown is None, "html_to_markdown dependencies are not installed.")
+class TestProcessAndUpdateCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.input_dir = Path(tempfile.mkdtemp(prefix="html_test_pool_"))
+
+    def tearDown(self):
+        shutil.rmtree(self.input_dir)
+
+    def test_process_pool_isolates_failed_conversions(self):
+        """
+        Test that a batch large enough for the process pool converts each file
+        independently and keeps the catalog order.
+        """
+        names = ["page0", "page1", "broken", "page2", "page3"]
+        self.assertGreaterEqual(len(names), html_to_markdown.MIN_JOBS_FOR_POOL)
+        for name in names:
+            (self.input_dir / f"{name}.html").write_text(f"<html><body><p>{name}</p></body></html>", encoding='utf-8')
+        # A directory in place of the output file makes writing this conversion fail
+        (self.input_dir / "broken.md").mkdir()
+
+        catalog_path = self.input_dir / "catalog.json"
+        catalog_path.write_text(json.dumps({
+            "documents": [{"path": f"{name}.html"} for name in names]
+        }), encoding='utf-8')
+
+        with patch('os.cpu_count', return_value=2):
+            catalog_data = html_to_markdown.process_and_update_catalog(catalog_path, self.input_dir)
+
+        self.assertEqual(
+            [doc["path"] for doc in catalog_data["documents"]],
+            ["page0.md", "page1.md", "broken.html", "page2.md", "page3.md"]
+        )
+        for name in ["page0", "page1", "page2", "page3"]:
+            self.assertTrue((self.input_dir / f"{name}.md").is_file())
+            self.assertFalse((self.input_dir / f"{name}.html").exists())
+        self.assertTrue((self.input_dir / "broken.html").is_file(), "The failed entry's HTML file should be kept")
+
+@unittest.skipIf(html_to_markdown is None, "html_to_markdown dependencies are not installed.")
+class TestFixLinksInMarkdown(unittest.TestCase):
+
+    def fix(self, markdown, base_url=None):
+        return html_to_markdown.fix_links_in_markdown(markdown, base_url)
+
+    def test_anchor_links_are_unchanged(self):
+        self.assertEqual(self.fix("[top](#top)"), "[top](#top)")
+        self.assertEqual(self.fix("[top](#top)", "http://example.com/docs/"), "[top](#top)")
+
+    def test_absolute_urls_are_unchanged(self):
+        for link in ("[a](http://example.com/page.html)", "[mail](mailto:someone@example.com)"):
+            with self.subTest(link=link):
+                self.assertEqual(self.fix(link), link)
+                self.assertEqual(self.fix(link, "http://example.com/docs/"), link)
+
+    def test_absolute_urls_with_leading_whitespace_are_unchanged(self):
+        for link in ("[a]( http://example.com/page.html)", "[a](\thttp://example.com/page.html)"):
+            with self.subTest(link=link):
+                self.assertEqual(self.fix(link), link)
+                self.assertEqual(self.fix(link, "http://example.com/docs/"), link)
+
+    def test_relative_html_links_are_rewritten_to_md(self):
+        self.assertEqual(self.fix("[a](guide/intro.html)"), "[a](guide/intro.md)")
+        self.assertEqual(self.fix("[a](guide/intro.HTM)"), "[a](guide/intro.md)")
+        self.assertEqual(self.fix("[a](notes.txt)"), "[a](notes.txt)")
+
+    def test_relative_links_are_resolved_against_base_url(self):
+        base_url = "http://example.com/docs/"
+        self.assertEqual(self.fix("[a](guide/intro.html)", base_url), "[a](http://example.com/docs/guide/intro.md)")
+        self.assertEqual(self.fix("[a](intro.htm)", base_url), "[a](http://example.com/docs/intro.md)")
+        # Root-relative links are not joined with the base URL
+        self.assertEqual(self.fix("[a](/root.html)", base_url), "[a](/root.md)")
+
 if __name__ == '__main__':
     unittest.main()
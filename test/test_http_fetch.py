@@ -1,3 +1,4 @@
+import argparse
 import unittest
 from unittest.mock import patch, mock_open
 import sys
@@ -135,5 +136,72 @@ class TestHttpFetchTool(unittest.TestCase):
         self.assertIn("The 'readable' command is not found", stderr_json["message"])
 
 
+class TestCanonicalizeUrl(unittest.TestCase):
+
+    def test_lowercases_scheme_and_host(self):
+        self.assertEqual(http_fetch._canonicalize_url("HTTP://Example.COM/Path"), "http://example.com/Path")
+
+    def test_drops_default_ports(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://example.com:80/a"), "http://example.com/a")
+        self.assertEqual(http_fetch._canonicalize_url("https://example.com:443/a"), "https://example.com/a")
+        self.assertEqual(http_fetch._canonicalize_url("http://example.com:8080/a"), "http://example.com:8080/a")
+        self.assertEqual(http_fetch._canonicalize_url("https://example.com:80/a"), "https://example.com:80/a")
+
+    def test_keeps_ipv6_brackets(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://[::1]:8000/a"), "http://[::1]:8000/a")
+        self.assertEqual(http_fetch._canonicalize_url("http://[::1]:80/a"), "http://[::1]/a")
+
+    def test_keeps_userinfo(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://user:pw@Example.com:80/a"), "http://user:pw@example.com/a")
+
+    def test_sorts_query_parameters(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://example.com/a?b=2&a=1&c="), "http://example.com/a?a=1&b=2&c=")
+
+    def test_drops_trailing_slash_and_fragment(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://example.com/docs/#intro"), "http://example.com/docs")
+
+    def test_invalid_port_is_kept(self):
+        self.assertEqual(http_fetch._canonicalize_url("http://a.com:99999/x"), "http://a.com:99999/x")
+        self.assertNotEqual(http_fetch._canonicalize_url("http://a.com:99999/x"), http_fetch._canonicalize_url("http://a.com/x"))
+
+class TestFindLinks(unittest.TestCase):
+
+    PAGE_URL = "http://example.com/docs/index.html"
+
+    def setUp(self):
+        args = argparse.Namespace(
+            url="http://example.com/docs/", base_url="http://example.com/docs/",
+            output_dir=".", recursive=True, depth=1
+        )
+        self.fetcher = http_fetch.WebFetcher(args)
+
+    def tearDown(self):
+        self.fetcher.session.close()
+
+    def page(self, head: str = "") -> str:
+        return (
+            f"<html><head>{head}</head><body>"
+            "<a href='\u30ac\u30a4\u30c9.html'>Guide</a><a href='/about'>About</a>"
+            "</body></html>"
+        )
+
+    def test_header_charset(self):
+        links = self.fetcher._find_links(self.page().encode('shift_jis'), self.PAGE_URL, 'shift_jis')
+        self.assertCountEqual(links, ["http://example.com/docs/\u30ac\u30a4\u30c9.html", "http://example.com/about"])
+
+    def test_meta_charset_only(self):
+        html = self.page("<meta charset='euc-jp'>").encode('euc-jp')
+        links = self.fetcher._find_links(html, self.PAGE_URL)
+        self.assertCountEqual(links, ["http://example.com/docs/\u30ac\u30a4\u30c9.html", "http://example.com/about"])
+
+    def test_bogus_charset_falls_back_to_detection(self):
+        html = self.page("<meta charset='utf-8'>").encode('utf-8')
+        links = self.fetcher._find_links(html, self.PAGE_URL, 'x-no-such-charset')
+        self.assertCountEqual(links, ["http://example.com/docs/\u30ac\u30a4\u30c9.html", "http://example.com/about"])
+
+    def test_empty_body(self):
+        self.assertEqual(self.fetcher._find_links(b"", self.PAGE_URL), [])
+        self.assertEqual(self.fetcher._find_links(b"", self.PAGE_URL, 'utf-8'), [])
+
 if __name__ == '__main__':
     unittest.main()
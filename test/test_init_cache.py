@@ -1,10 +1,9 @@
 import unittest
-import subprocess
-import os
 import shutil
-import sys
 from pathlib import Path
 
+from _tool_harness import invoke_tool
+
 class TestInitCache(unittest.TestCase):
 
     def setUp(self):
@@ -37,22 +36,10 @@ class TestInitCache(unittest.TestCase):
         self.assertTrue(stale_cache_file.exists())
 
         # 2. Run the tool
-        # Since ragmaker-init-cache might not be in PATH, execute the script directly
-        script_path = Path("src/ragmaker/tools/init_cache.py").resolve()
-        args = [sys.executable, str(script_path)]
-
-        # Add src to PYTHONPATH so the script can import ragmaker
-        env = os.environ.copy()
-        env['PYTHONPATH'] = str(Path("src").resolve()) + os.pathsep + env.get('PYTHONPATH', '')
-
-        result = subprocess.run(args, capture_output=True, text=True, check=False, encoding='utf-8', env=env)
+        exit_code, stdout, _stderr = invoke_tool('ragmaker.tools.init_cache', [])
 
-        # For debugging
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-
-        self.assertEqual(result.returncode, 0, "Script execution failed")
-        self.assertIn("success", result.stdout)
+        self.assertEqual(exit_code, 0, "Script execution failed")
+        self.assertIn("success", stdout)
 
         # 3. Verify the results
         # The new cache directory should exist
@@ -74,17 +61,10 @@ class TestInitCache(unittest.TestCase):
         self.assertFalse(self.tmp_dir.exists())
 
         # Run the tool
-        script_path = Path("src/ragmaker/tools/init_cache.py").resolve()
-        args = [sys.executable, str(script_path)]
-
-        # Add src to PYTHONPATH so the script can import ragmaker
-        env = os.environ.copy()
-        env['PYTHONPATH'] = str(Path("src").resolve()) + os.pathsep + env.get('PYTHONPATH', '')
-
-        result = subprocess.run(args, capture_output=True, text=True, check=False, encoding='utf-8', env=env)
+        exit_code, stdout, _stderr = invoke_tool('ragmaker.tools.init_cache', [])
 
-        self.assertEqual(result.returncode, 0, "Script execution failed")
-        self.assertIn("success", result.stdout)
+        self.assertEqual(exit_code, 0, "Script execution failed")
+        self.assertIn("success", stdout)
 
         # Verify the result
         fresh_cache_dir = self.tmp_dir / "cache"
@@ -12,8 +12,30 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../s
 
 from ragmaker.tools.install_kb import install_knowledge_base
 
+def _link_or_copy(src, dst):
+    """Hardlinks src to dst, falling back to a copy where links are unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
 class TestInstallKB(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Build the immutable source KB structure once and hardlink it into each test.
+        # Tests that rewrite a template file must unlink it first so the template is untouched.
+        cls.template_dir = tempfile.TemporaryDirectory()
+        cls.template_kb = Path(cls.template_dir.name) / "source_kb"
+        (cls.template_kb / "cache").mkdir(parents=True)
+
+        # Create a dummy file in cache
+        (cls.template_kb / "cache" / "doc1.txt").write_text("content 1")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.template_dir.cleanup()
+
     def setUp(self):
         self.test_dir = tempfile.TemporaryDirectory()
         self.root = Path(self.test_dir.name)
@@ -21,11 +43,7 @@ class TestInstallKB(unittest.TestCase):
         self.target_kb = self.root / "target_kb"
 
         # Setup source KB structure
-        self.source_kb.mkdir()
-        (self.source_kb / "cache").mkdir()
-
-        # Create a dummy file in cache
-        (self.source_kb / "cache" / "doc1.txt").write_text("content 1")
+        shutil.copytree(self.template_kb, self.source_kb, copy_function=_link_or_copy)
 
     def tearDown(self):
         self.test_dir.cleanup()
@@ -457,6 +475,7 @@ class TestInstallKB(unittest.TestCase):
         with open(self.source_kb / "catalog.json", 'w') as f:
             json.dump(catalog_data, f)
         (self.source_kb / "cache").mkdir(exist_ok=True)
+        (self.source_kb / "cache" / "doc1.txt").unlink()
         (self.source_kb / "cache" / "doc1.txt").write_text("content")
 
         # Install with flatten=True
@@ -481,6 +500,7 @@ class TestInstallKB(unittest.TestCase):
         source_cache.mkdir(parents=True, exist_ok=True)
         with open(source_cache / "catalog.json", 'w') as f:
             json.dump(catalog_data, f)
+        (source_cache / "doc1.txt").unlink()
         (source_cache / "doc1.txt").write_text("content")
 
         # Install using the cache directory as the source, flatten=True
@@ -5,59 +5,76 @@ import json
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 class TestPackageDependency(unittest.TestCase):
-    def run_tool_isolated(self, tool_path, args=None):
-        if args is None:
-            args = []
+    TOOLS = [
+        ("file_sync.py", ["--source-dir", ".", "--dest-dir", "."]),
+        ("install_kb.py", ["--source", ".", "--target-kb-root", "."]),
+        ("init_cache.py", []),
+    ]
 
-        # Create a temporary directory to isolate the script
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            script_name = tool_path.name
-            target_script_path = temp_path / script_name
+    @classmethod
+    def setUpClass(cls):
+        # Prepare the environment once: everything except PYTHONPATH
+        cls._clean_env = {k: v for k, v in os.environ.items() if k != 'PYTHONPATH'}
+        cls._py = sys.executable
 
-            # Copy the script to the temporary directory
-            shutil.copy2(tool_path, target_script_path)
+        # Isolate all scripts in one temporary directory shared by every run.
+        # Resolve the tools directory once and list it in a single scan.
+        cls._tools_dir = Path("src/ragmaker/tools").resolve(strict=True)
+        with os.scandir(cls._tools_dir) as entries:
+            cls._tool_paths = {e.name: Path(e.path) for e in entries}
 
-            # Prepare the environment: remove PYTHONPATH
-            env = os.environ.copy()
-            if 'PYTHONPATH' in env:
-                del env['PYTHONPATH']
+        cls._isolated = Path(tempfile.mkdtemp(prefix="ragmaker_isolated_"))
+        for tool_name, _ in cls.TOOLS:
+            tool_path = cls._tool_paths.get(tool_name)
+            if tool_path is None:
+                continue  # Reported by the test itself
+            # Only the script's bytes are needed, so fall back to a plain copy
+            # without metadata across filesystems.
+            try:
+                os.link(tool_path, cls._isolated / tool_name)
+            except OSError:
+                shutil.copyfile(tool_path, cls._isolated / tool_name)
 
-            # Run the script from the temporary directory
-            # Use -S to disable site-packages, ensuring strict isolation
-            cmd = [sys.executable, "-S", str(target_script_path)] + args
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env, cwd=temp_path)
-            return result
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._isolated, ignore_errors=True)
 
-    def test_tools_require_package(self):
-        tools = [
-            ("file_sync.py", ["--source-dir", ".", "--dest-dir", "."]),
-            ("install_kb.py", ["--source", ".", "--target-kb-root", "."]),
-            ("init_cache.py", []),
-        ]
+    def run_tool_isolated(self, script_name, args=None):
+        if args is None:
+            args = []
 
-        base_tool_path = Path("src/ragmaker/tools").resolve()
+        # Run the script from the isolated directory
+        # Use -S to disable site-packages, ensuring strict isolation
+        cmd = [self._py, "-S", str(self._isolated / script_name)] + args
+        return subprocess.run(cmd, capture_output=True, env=self._clean_env, cwd=self._isolated)
 
-        for tool_name, args in tools:
-            with self.subTest(tool=tool_name):
-                tool_path = base_tool_path / tool_name
+    def test_tools_require_package(self):
+        tools = self.TOOLS
 
-                # Verify tool exists before running
-                self.assertTrue(tool_path.exists(), f"Tool {tool_name} not found at {tool_path}")
+        # Verify tools exist before running
+        for tool_name, _ in tools:
+            self.assertIn(tool_name, self._tool_paths, f"Tool {tool_name} not found in {self._tools_dir}")
 
-                result = self.run_tool_isolated(tool_path, args)
+        # The runs are independent and spend their time in subprocess.run (which
+        # releases the GIL), so launch them concurrently and assert afterwards.
+        with ThreadPoolExecutor(max_workers=len(tools)) as executor:
+            results = list(executor.map(lambda tool: self.run_tool_isolated(*tool), tools))
 
+        for (tool_name, _), result in zip(tools, results):
+            with self.subTest(tool=tool_name):
                 # Expect failure
                 self.assertNotEqual(result.returncode, 0, f"Tool {tool_name} should fail without package")
 
                 # Expect JSON output on stderr
+                stderr = result.stderr.decode('utf-8')
                 try:
-                    error_data = json.loads(result.stderr)
+                    error_data = json.loads(stderr)
                 except json.JSONDecodeError:
-                    self.fail(f"Tool {tool_name} stderr is not valid JSON: {result.stderr}")
+                    self.fail(f"Tool {tool_name} stderr is not valid JSON: {stderr}")
 
                 self.assertIsInstance(error_data, dict, "Error data should be a dictionary")
                 self.assertEqual(error_data.get("status"), "error")
@@ -1,49 +1,43 @@
 import unittest
 import sys
-import os
-import shutil
-import subprocess
-from pathlib import Path
+from unittest.mock import patch
 
-class TestHttpPathHandlingIntegration(unittest.TestCase):
+from _tool_harness import ScratchDirTestCase, invoke_tool
 
-    def setUp(self):
-        self.base_test_dir = Path("test_temp_http_fetch")
-        if self.base_test_dir.exists():
-            shutil.rmtree(self.base_test_dir)
-        self.base_test_dir.mkdir()
+@unittest.skipUnless(sys.platform == "win32", "Path sanitization test is for Windows.")
+class TestHttpPathHandlingIntegration(ScratchDirTestCase):
 
-    def tearDown(self):
-        if self.base_test_dir.exists():
-            shutil.rmtree(self.base_test_dir)
+    def setUp(self):
+        super().setUp()
+        self.base_test_dir = self.scratch_dir
 
-    def run_test_case(self, input_path_part, expected_sanitized_part):
+    def run_test_case(self, test_dir, input_path_part, expected_sanitized_part):
         """Helper to run a single path sanitization test case."""
-        if sys.platform != "win32":
-            self.skipTest("Path sanitization test is for Windows.")
-
-        # The script will create the directory inside our base test dir
-        full_input_path = self.base_test_dir / input_path_part
+        # The script will create the directory inside the given test dir
+        full_input_path = test_dir / input_path_part
         
         args = [
-            sys.executable, "-m", "src.ragmaker.tools.http_fetch",
             "--url", "http://example.com",
             "--base-url", "http://example.com",
             "--output-dir", str(full_input_path),
             "--no-recursive"
         ]
 
-        process = subprocess.run(args, capture_output=True, text=True, encoding='utf-8', errors='replace')
-
-        if not expected_sanitized_part:
-            self.assertNotEqual(process.returncode, 0)
-            self.assertIn("provided --output-dir path is empty", process.stderr)
-        else:
-            if process.returncode != 0:
-                print("STDERR:", process.stderr)
-            self.assertEqual(process.returncode, 0)
-            full_expected_path = self.base_test_dir / expected_sanitized_part
-            self.assertTrue(full_expected_path.is_dir(), f"Directory '{full_expected_path}' was not created.")
+        # Only the --output-dir handling in main() is under test, so no page is fetched.
+        with patch("ragmaker.tools.http_fetch.WebFetcher") as mock_fetcher:
+            mock_fetcher.return_value.documents = []
+            if not expected_sanitized_part:
+                with self.assertLogs("ragmaker.tools.http_fetch", level="ERROR") as logs:
+                    returncode, stdout, stderr = invoke_tool("ragmaker.tools.http_fetch", args)
+                self.assertNotEqual(returncode, 0)
+                self.assertIn("provided --output-dir path is empty", "\n".join(logs.output))
+            else:
+                returncode, stdout, stderr = invoke_tool("ragmaker.tools.http_fetch", args)
+                if returncode != 0:
+                    print("STDERR:", stderr)
+                self.assertEqual(returncode, 0)
+                full_expected_path = test_dir / expected_sanitized_part
+                self.assertTrue(full_expected_path.is_dir(), f"Directory '{full_expected_path}' was not created.")
 
     def test_path_sanitization_scenarios(self):
         """Tests various path sanitization scenarios for http_fetch."""
@@ -55,13 +49,12 @@ class TestHttpPathHandlingIntegration(unittest.TestCase):
             "Empty path after strip": (' " " ', ""),
         }
 
-        for name, (input_part, expected_part) in test_cases.items():
+        for i, (name, (input_part, expected_part)) in enumerate(test_cases.items()):
             with self.subTest(name=name):
-                # Recreate the directory for each subtest to avoid conflicts
-                if self.base_test_dir.exists():
-                    shutil.rmtree(self.base_test_dir)
-                self.base_test_dir.mkdir()
-                self.run_test_case(input_part, expected_part)
+                # Use a separate directory for each subtest to avoid conflicts
+                subtest_dir = self.base_test_dir / f"sub_{i}"
+                subtest_dir.mkdir()
+                self.run_test_case(subtest_dir, input_part, expected_part)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -17,34 +17,26 @@ class TestSafeExport(unittest.TestCase):
     def tearDown(self):
         self.temp_dir.cleanup()
 
-    def test_safe_export_merges_files(self):
+    def test_safe_export_merges_overwrites_and_nests(self):
+        # These scenarios share no paths, so one src/dst pair covers all of them.
         (self.src_dir / "new.txt").write_text("new content")
         (self.dst_dir / "old.txt").write_text("old content")
-
-        safe_export(self.src_dir, self.dst_dir)
-
-        self.assertTrue((self.dst_dir / "new.txt").exists())
-        self.assertTrue((self.dst_dir / "old.txt").exists())
-        self.assertEqual((self.dst_dir / "new.txt").read_text(), "new content")
-        self.assertEqual((self.dst_dir / "old.txt").read_text(), "old content")
-
-    def test_safe_export_overwrites_existing(self):
         (self.src_dir / "conflict.txt").write_text("new version")
         (self.dst_dir / "conflict.txt").write_text("old version")
-
-        safe_export(self.src_dir, self.dst_dir)
-
-        self.assertTrue((self.dst_dir / "conflict.txt").exists())
-        self.assertEqual((self.dst_dir / "conflict.txt").read_text(), "new version")
-
-    def test_safe_export_nested_directories(self):
         (self.src_dir / "subdir").mkdir()
         (self.src_dir / "subdir" / "file.txt").write_text("nested")
 
         safe_export(self.src_dir, self.dst_dir)
 
-        self.assertTrue((self.dst_dir / "subdir" / "file.txt").exists())
-        self.assertEqual((self.dst_dir / "subdir" / "file.txt").read_text(), "nested")
+        with self.subTest("merges files"):
+            self.assertEqual((self.dst_dir / "new.txt").read_text(), "new content")
+            self.assertEqual((self.dst_dir / "old.txt").read_text(), "old content")
+
+        with self.subTest("overwrites existing"):
+            self.assertEqual((self.dst_dir / "conflict.txt").read_text(), "new version")
+
+        with self.subTest("nested directories"):
+            self.assertEqual((self.dst_dir / "subdir" / "file.txt").read_text(), "nested")
 
     def test_safe_export_resolves_file_directory_conflict(self):
         # src/foo is a directory
@@ -5,6 +5,8 @@ import os
 import json
 from pathlib import Path
 
+from _tool_harness import invoke_tool
+
 class TestWriteFileTool(unittest.TestCase):
 
     def test_write_file_success(self):
@@ -52,20 +54,14 @@ class TestWriteFileTool(unittest.TestCase):
             # Pre-condition: the directory should not exist
             self.assertFalse(nested_dir.exists())
 
-            # Run the write_file tool
-            process = subprocess.run(
-                [
-                    "python", "-m", "src.ragmaker.tools.write_file",
-                    "--path", str(file_path),
-                    "--content", test_content
-                ],
-                capture_output=True,
-                text=True,
-                encoding='utf-8'
-            )
+            # Run the write_file tool in-process; the subprocess path is covered above
+            rc, out, err = invoke_tool("ragmaker.tools.write_file", [
+                "--path", str(file_path),
+                "--content", test_content
+            ])
 
             # Check for success
-            self.assertEqual(process.returncode, 0, f"Tool exited with error: {process.stderr}")
+            self.assertEqual(rc, 0, f"Tool exited with error: {err}")
 
             # Verify the directory and file were created
             self.assertTrue(nested_dir.exists())